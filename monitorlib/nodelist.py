@@ -1,8 +1,11 @@
 '''Loading and handling lists of nodes.'''
 
+from collections import deque
 from fnmatch import fnmatch
+import heapq
 import multiprocessing.pool
 import re
+import time
 
 import monitorlib.nodes as monitorlib_nodes
 
@@ -31,6 +34,23 @@ def _insert_arg0(func, arg0):
         return func(arg0, *args, **kwargs)
     return wrapper
 
+def _merge_events(node_events):
+    '''Merge per-node lists of log events by their `at` timestamp.
+
+       `node_events` is a list of `(node, events)` tuples, where each list
+       of events is in the order it was received. Yields
+       `(node, line, match)` tuples in chronological order.
+    '''
+    def decorate(idx, node, events):
+        # pylint: disable=missing-docstring
+        for seq, (line, match) in enumerate(events):
+            yield int(match.group('at')), idx, seq, node, line, match
+
+    streams = [decorate(idx, node, events)
+               for idx, (node, events) in enumerate(node_events)]
+    for _, _, _, node, line, match in heapq.merge(*streams):
+        yield node, line, match
+
 def parse_node_file(filename, monitor):
     '''Return a list of nodes in `filename`.'''
     nodes = list()
@@ -83,6 +103,67 @@ class NodeList(object):
         '''Remove a node from the node list.'''
         self.nodes.remove(node)
 
+    def tail(self, n=10, raw=False, do_print=True, follow=False,
+             interval=1.0):
+        '''Return recently received log events of all nodes.
+
+           Unlike calling `tail` on each node, the log events of all nodes
+           are merged into one list ordered by their timestamps. If
+           `do_print` is True (default), the result will be printed.
+
+           If `follow` is True, keep printing new log events as they are
+           received, checking every `interval` seconds, until interrupted.
+        '''
+        counts = dict()
+        node_events = list()
+        for node in self.nodes:
+            events, counts[node] = node.log_events_since(0)
+            node_events.append((node, events))
+
+        # Only the last `n` events are formatted.
+        events = deque(_merge_events(node_events), maxlen=n)
+        lines = [self._format_event(node, line, match, raw)
+                 for node, line, match in events]
+
+        if do_print and (lines or not follow):
+            print '\n'.join(lines) if lines else '<<NO OUTPUT>>'
+        if follow:
+            try:
+                for line in self._follow(counts, raw, interval):
+                    print line
+            except KeyboardInterrupt:
+                pass
+        return lines
+
+    def follow(self, raw=False, interval=1.0):
+        '''Return a generator of log events received from now on.
+
+           The log events of all nodes are yielded in timestamp order,
+           checking for new events every `interval` seconds.
+        '''
+        counts = {n: n.log_events_since(0)[1] for n in self.nodes}
+        return self._follow(counts, raw, interval)
+
+    def _follow(self, counts, raw, interval):
+        '''Yield log events received after `counts` events per node.'''
+        while True:
+            node_events = list()
+            for node in self.nodes:
+                events, counts[node] = node.log_events_since(counts[node])
+                if events:
+                    node_events.append((node, events))
+
+            for node, line, match in _merge_events(node_events):
+                yield self._format_event(node, line, match, raw)
+            time.sleep(interval)
+
+    @staticmethod
+    def _format_event(node, line, match, raw):
+        '''Return a log event, formatted by `node` unless `raw` is set.'''
+        if raw:
+            return line
+        return node.format_event(match)
+
     def _sequential(self, name):
         '''Returns a function that runs `name` on all nodes sequentially.'''
         def run_sequential(*args, **kwargs):
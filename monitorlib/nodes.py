@@ -7,6 +7,7 @@ import re
 import socket
 import subprocess
 import sys
+import threading
 import time
 import types
 
@@ -15,6 +16,23 @@ _RE_PING = r'(?P<at>\d+) (?P<ip>[\d+\.]+):(?P<port>\d+) ' + \
 _TAIL_DATE_FMT = '%y-%m-%d %H:%M:%S'
 _NODE_TIMEOUT = 4.0
 _MAX_LOG_EVENTS = 100
+_MAX_TIMESTR_CACHE = 4096
+
+# Cache of rendered timestamps, keyed by seconds since the epoch.
+_timestr_cache = dict()
+
+def _format_at(at):
+    '''Return the `at` field of a log event (in ms) as a date string.'''
+    secs = int(at) // 1000
+    try:
+        return _timestr_cache[secs]
+    except KeyError:
+        pass
+    if len(_timestr_cache) >= _MAX_TIMESTR_CACHE:
+        _timestr_cache.clear()
+    timestr = datetime.fromtimestamp(secs).strftime(_TAIL_DATE_FMT)
+    _timestr_cache[secs] = timestr
+    return timestr
 
 class Node(object):
     '''Base class for nodes.'''
@@ -27,12 +45,14 @@ class Node(object):
 
     log_prefix = None
     log_events = None
+    log_count = 0
     monitor = None
 
     def __init__(self, monitor, info):
         self.monitor = monitor
         self.gid = info['gid']
         self.log_events = list()
+        self._log_lock = threading.Lock()
 
         # Register callback for pings from this node.
         re_ping = re.compile(_RE_PING.format(info['gid']))
@@ -81,13 +101,7 @@ class Node(object):
             lines = [line for line, _ in events]
         else:
             # Make the lines look pretty.
-            lines = list()
-            for _, match in events:
-                groups = match.groupdict()
-                ts = float(groups['at'])/1000.
-                timestr = datetime.fromtimestamp(ts).strftime(_TAIL_DATE_FMT)
-                line = '[{} {:>25}] {}'.format(timestr, self, groups['logline'])
-                lines.append(line)
+            lines = [self.format_event(match) for _, match in events]
             if not lines:
                 lines.append('[{:>25}] <<NO OUTPUT>>'.format(self))
                 
@@ -95,11 +109,32 @@ class Node(object):
             print '\n'.join(lines)
         return lines
 
+    def format_event(self, match):
+        '''Return a log event `match` formatted for display.'''
+        return '[{} {:>25}] {}'.format(_format_at(match.group('at')), self,
+                                       match.group('logline'))
+
+    def log_events_since(self, count):
+        '''Return log events received after the first `count` events.
+
+           Returns a tuple of the list of new events and the total number
+           of events received so far, which can be passed as `count` in the
+           next call. Events that have already been dropped from the buffer
+           are skipped.
+        '''
+        with self._log_lock:
+            new = min(self.log_count - count, len(self.log_events))
+            if new <= 0:
+                return list(), self.log_count
+            return list(self.log_events[-new:]), self.log_count
+
     def _le_all_listener(self, line, match):
         '''Callback for any log event (LE_ALL) from the node.'''
-        self.log_events.append((line, match))
-        if len(self.log_events) > _MAX_LOG_EVENTS:
-            self.log_events.pop(0)
+        with self._log_lock:
+            self.log_events.append((line, match))
+            self.log_count += 1
+            if len(self.log_events) > _MAX_LOG_EVENTS:
+                self.log_events.pop(0)
 
     def is_online(self):
         '''Return whether a ping was received from the node recently.'''